@@ -1,15 +1,15 @@
 import speech_recognition as sr
 
-# The names we'll cycle through
-REPLIES = ["Vaibhav", "Manas", "Dev"]
+# Shared phrase/reply configuration lives in bibb.Config
+from bibb import Config
 
 def listen_for_who_is_he(recognizer, mic):
     """
     Listen on the mic, return the transcribed text in lowercase.
     Returns empty string on failure.
+    Ambient calibration is done once by the caller, not per listen.
     """
     with mic as source:
-        recognizer.adjust_for_ambient_noise(source, duration=0.5)
         print("🎤 Listening… (say 'who is he')")
         audio = recognizer.listen(source)
     try:
@@ -25,14 +25,18 @@ def main():
     recognizer = sr.Recognizer()
     mic = sr.Microphone()
 
+    # Calibrate once up front instead of on every loop iteration
+    with mic as source:
+        recognizer.adjust_for_ambient_noise(source, duration=0.5)
+
     count = 0
     print("🌟 Ready. Speak “who is he” to unveil a name. Ctrl+C to exit.\n")
 
     try:
         while True:
             text = listen_for_who_is_he(recognizer, mic)
-            if "who is he" in text:
-                name = REPLIES[count % len(REPLIES)]
+            if Config.PHRASE in text:
+                name = Config.REPLIES[count % len(Config.REPLIES)]
                 print(f"🤖 → {name}\n")
                 count += 1
             # otherwise, remain still, listening for your next invocation